@@ -6,6 +6,7 @@ class Settings(BaseSettings):
     api_version: str
     endpoint: str
     embedding_model: str
+    embedding_base64: bool = False
 
 
     class Config:
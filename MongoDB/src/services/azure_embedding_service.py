@@ -1,4 +1,6 @@
+import base64
 import logging
+import numpy as np
 from openai import AzureOpenAI
 from src.config import settings
 
@@ -13,12 +15,22 @@ class AzureEmbeddingService:
             azure_endpoint=settings.endpoint,
         )
         self.model = settings.embedding_model
+        self.use_base64 = settings.embedding_base64
 
-    def get_embedding(self, text: str) -> list[float]:
+    def get_embedding(self, text: str) -> list[float] | np.ndarray:
         """
         Generate an embedding for the given text using Azure OpenAI.
+        When base64 transport is enabled the embedding is returned as a
+        float32 numpy array decoded directly from the response payload.
         """
         try:
+            if self.use_base64:
+                response = self.client.embeddings.create(
+                    model=self.model,
+                    input=[text],
+                    encoding_format="base64"
+                )
+                return self.decode_embedding(response.data[0].embedding)
             response = self.client.embeddings.create(
                 model=self.model,
                 input=[text]
@@ -27,3 +39,11 @@ class AzureEmbeddingService:
         except Exception as e:
             logger.error(f"Embedding generation failed: {e}", exc_info=True)
             return []
+
+    @staticmethod
+    def decode_embedding(encoded: str) -> np.ndarray:
+        """
+        Decode a base64 embedding into a read-only float32 array without
+        going through Python floats.
+        """
+        return np.frombuffer(base64.b64decode(encoded), dtype=np.float32)
@@ -28,12 +28,12 @@ class MongoDBVectorService(AzureEmbeddingService):
         operations = []
         for item in vector_data:
             embedding = self.get_embedding(item['text'])
-            if embedding:
+            if len(embedding):
                 operations.append(
                     UpdateOne(
                         {'key': item['key']},
                         {'$set': {
-                            'embedding': embedding,
+                            'embedding': self.serialize_embedding(embedding),
                             'metadata': item.get('metadata', {}),
                         }},
                         upsert=True
@@ -67,13 +67,13 @@ class MongoDBVectorService(AzureEmbeddingService):
 
     def update_vector(self, key: str, new_text: str, new_metadata: dict):
         embedding = self.get_embedding(new_text)
-        if not embedding:
+        if not len(embedding):
             logger.warning(f"Failed to get embedding for key {key}")
             return None
         try:
             result = self.collection.update_one(
                 {'key': key},
-                {'$set': {'embedding': embedding, 'metadata': new_metadata}},
+                {'$set': {'embedding': self.serialize_embedding(embedding), 'metadata': new_metadata}},
                 upsert=True
             )
             logger.info(f"Vector with key {key} updated successfully")
@@ -101,7 +101,7 @@ class MongoDBVectorService(AzureEmbeddingService):
 
     def filtered_query(self, query_text: str, filter_expression: dict, top_k: int = 5):
         embedding = self.get_embedding(query_text)
-        if not embedding:
+        if not len(embedding):
             return {"error": "Failed to generate embedding"}
 
         pipeline = [
@@ -110,7 +110,7 @@ class MongoDBVectorService(AzureEmbeddingService):
                 "$search": {
                     "index": "your_vector_search_index_name",  # replace with your Atlas vector search index name
                     "knnBeta": {
-                        "vector": embedding,
+                        "vector": self.serialize_embedding(embedding),
                         "path": "embedding",
                         "k": top_k
                     }
@@ -137,7 +137,7 @@ class MongoDBVectorService(AzureEmbeddingService):
 
     def query_vector_index(self, query_text: str, top_k: int = 5):
         embedding = self.get_embedding(query_text)
-        if not embedding:
+        if not len(embedding):
             return {"error": "Failed to generate embedding"}
 
         pipeline = [
@@ -145,7 +145,7 @@ class MongoDBVectorService(AzureEmbeddingService):
                 "$search": {
                     "index": "your_vector_search_index_name",  # replace with your Atlas vector search index
                     "knnBeta": {
-                        "vector": embedding,
+                        "vector": self.serialize_embedding(embedding),
                         "path": "embedding",
                         "k": top_k
                     }
@@ -174,9 +174,18 @@ class MongoDBVectorService(AzureEmbeddingService):
             return None
 
     @staticmethod
-    def calculate_distance(vec1: list[float], vec2: list[float], method: str = "cosine") -> float:
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
+    def serialize_embedding(embedding: list[float] | np.ndarray) -> list[float]:
+        """
+        Convert an embedding to the plain list form expected by the API.
+        """
+        if isinstance(embedding, np.ndarray):
+            return embedding.tolist()
+        return embedding
+
+    @staticmethod
+    def calculate_distance(vec1: list[float] | np.ndarray, vec2: list[float] | np.ndarray, method: str = "cosine") -> float:
+        v1 = np.asarray(vec1)
+        v2 = np.asarray(vec2)
         if method == "cosine":
             cos_sim = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2))
             return float(cos_sim)
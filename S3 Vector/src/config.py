@@ -11,6 +11,7 @@ class Settings(BaseSettings):
     s3_region: str
     s3_bucket: str
     s3_vector_index: str
+    embedding_base64: bool = False
 
     class Config:
         env_file = ".env"
@@ -27,10 +27,10 @@ class S3VectorService(AzureEmbeddingService):
         vectors = []
         for item in vector_data:
             embedding = self.get_embedding(item['text'])
-            if embedding:
+            if len(embedding):
                 vectors.append({
                     "key": item['key'],
-                    "data": {"float32": embedding},
+                    "data": {"float32": self.serialize_embedding(embedding)},
                     "metadata": item['metadata']
                 })
 
@@ -71,7 +71,7 @@ class S3VectorService(AzureEmbeddingService):
     def update_vector(self, key: str, new_text: str, new_metadata: dict):
         """Update an existing vector by key."""
         embedding = self.get_embedding(new_text)
-        if not embedding:
+        if not len(embedding):
             logger.warning(f"Failed to get embedding for key {key}")
             return None
         try:
@@ -80,7 +80,7 @@ class S3VectorService(AzureEmbeddingService):
                 indexName=self.index_name,
                 vectors=[{
                     "key": key,
-                    "data": {"float32": embedding},
+                    "data": {"float32": self.serialize_embedding(embedding)},
                     "metadata": new_metadata
                 }]
             )
@@ -136,13 +136,13 @@ class S3VectorService(AzureEmbeddingService):
 
     def filtered_query(self, query_text: str, filter_expression: dict, top_k: int = 5):
         embedding = self.get_embedding(query_text)
-        if not embedding:
+        if not len(embedding):
             return {"error": "Failed to generate embedding"}
         try:
             response = self.s3vectors.query_vectors(
                 vectorBucketName=self.s3_bucket,
                 indexName=self.index_name,
-                queryVector={"float32": embedding},
+                queryVector={"float32": self.serialize_embedding(embedding)},
                 topK=top_k,
                 returnDistance=True,
                 returnMetadata=True,
@@ -194,13 +194,13 @@ class S3VectorService(AzureEmbeddingService):
 
     def query_vector_index(self, query_text: str, top_k: int = 5, return_metadata: bool = True):
         embedding = self.get_embedding(query_text)
-        if not embedding:
+        if not len(embedding):
             return {"error": "Failed to generate embedding"}
         try:
             response = self.s3vectors.query_vectors(
                 vectorBucketName=self.s3_bucket,
                 indexName=self.index_name,
-                queryVector={"float32": embedding},
+                queryVector={"float32": self.serialize_embedding(embedding)},
                 topK=top_k,
                 returnDistance=True,
                 returnMetadata=return_metadata,
@@ -255,13 +255,23 @@ class S3VectorService(AzureEmbeddingService):
 
 
     @staticmethod
-    def calculate_distance(vec1: list[float], vec2: list[float], method: str = "cosine") -> float:
+    def serialize_embedding(embedding: list[float] | np.ndarray) -> list[float]:
+        """
+        Convert an embedding to the plain list form expected by the API.
+        """
+        if isinstance(embedding, np.ndarray):
+            return embedding.tolist()
+        return embedding
+
+
+    @staticmethod
+    def calculate_distance(vec1: list[float] | np.ndarray, vec2: list[float] | np.ndarray, method: str = "cosine") -> float:
         """
         Calculate distance/similarity between two vectors.
         Supported methods: cosine, euclidean
         """
-        v1 = np.array(vec1)
-        v2 = np.array(vec2)
+        v1 = np.asarray(vec1)
+        v2 = np.asarray(vec2)
         if method == "cosine":
             cos_sim = np.dot(v1, v2) / (np.linalg.norm(v1) * np.linalg.norm(v2))
             return float(cos_sim)